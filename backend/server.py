@@ -1,12 +1,21 @@
-from fastapi import FastAPI, APIRouter, HTTPException, Query
+from fastapi import FastAPI, APIRouter, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 import aiosqlite
 import os
+import io
+import sys
+import csv
+import json
+import time
+import zlib
 import logging
+from collections import OrderedDict
 from pathlib import Path
 from pydantic import BaseModel, ConfigDict
-from typing import List, Optional, AsyncGenerator
+from typing import Any, Dict, Hashable, List, Literal, Optional, AsyncGenerator, AsyncIterator
 from contextlib import asynccontextmanager
 
 ROOT_DIR = Path(__file__).parent
@@ -15,6 +24,17 @@ load_dotenv(ROOT_DIR / '.env')
 # SQLite Database Name
 DB_NAME = os.environ.get('DB_NAME', 'askmycity.db')
 
+# Result cache budget (bytes) and expiry (seconds, 0 disables TTL)
+CACHE_MAX_BYTES = int(os.environ.get('CACHE_MAX_BYTES', 4 * 1024 * 1024))
+CACHE_TTL_SECONDS = float(os.environ.get('CACHE_TTL_SECONDS', 0))
+CACHE_NEGATIVE_MAX_BYTES = int(os.environ.get('CACHE_NEGATIVE_MAX_BYTES', 512 * 1024))
+CACHE_NEGATIVE_TTL_SECONDS = float(os.environ.get('CACHE_NEGATIVE_TTL_SECONDS', 60))
+# How stale the catalog version used to validate cache entries may get
+CACHE_VERSION_CHECK_SECONDS = float(os.environ.get('CACHE_VERSION_CHECK_SECONDS', 1))
+
+# Seeded contact used where a city's real municipal number is not yet known
+PLACEHOLDER_CONTACT = "1800-XXX-XXXX"
+
 # Define lifespan context manager
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator:
@@ -57,10 +77,158 @@ class CityWithServices(BaseModel):
     state_name: str
     services: List[Service]
 
+class ServiceTypeStats(BaseModel):
+    service_type: str
+    services: int
+    cities: int
+    missing_cities: int
+    placeholder_cities: int
+
+class CoverageGaps(BaseModel):
+    cities_missing_women_helpline: int
+    cities_with_placeholder_municipal_contact: int
+
+class CatalogStats(BaseModel):
+    total_cities: int
+    total_services: int
+    cities_per_state: Dict[str, int]
+    service_types: List[ServiceTypeStats]
+    coverage_gaps: CoverageGaps
+
+class CacheStats(BaseModel):
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    bytes: int
+    max_bytes: int
+
+class CacheReport(BaseModel):
+    results: CacheStats
+    not_found: CacheStats
+
+
+def deep_sizeof(obj: Any) -> int:
+    """Approximate memory held by a JSON-like value, containers included"""
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_sizeof(k) + deep_sizeof(v) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple)):
+        size += sum(deep_sizeof(item) for item in obj)
+    return size
+
+
+class ResultCache:
+    """
+    LRU cache of API results bounded by an approximate byte budget rather
+    than entry count. Entries are tagged with the catalog version they were
+    read at and dropped once it moves on; they can also expire after a TTL.
+    """
+
+    # Per-entry bookkeeping not visible to sys.getsizeof: the OrderedDict
+    # slot and link node plus the (value, size, version, expiry) tuple
+    ENTRY_OVERHEAD = 100
+
+    def __init__(self, max_bytes: int, ttl_seconds: float = 0):
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, version: int, default: Any = None, count_miss: bool = True) -> Any:
+        entry = self._entries.get(key)
+        if entry is not None:
+            value, size, entry_version, expires_at = entry
+            if entry_version != version or (expires_at and expires_at <= time.monotonic()):
+                self._remove(key)
+            else:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+        if count_miss:
+            self.misses += 1
+        return default
+
+    def record_miss(self) -> None:
+        self.misses += 1
+
+    def set(self, key: Hashable, value: Any, version: int) -> None:
+        size = deep_sizeof(key) + deep_sizeof(value) + self.ENTRY_OVERHEAD
+        if key in self._entries:
+            self._remove(key)
+        if size > self.max_bytes:
+            return
+
+        expires_at = time.monotonic() + self.ttl_seconds if self.ttl_seconds > 0 else 0
+        self._entries[key] = (value, size, version, expires_at)
+        self.current_bytes += size
+
+        while self.current_bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.current_bytes = 0
+
+    def stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "bytes": self.current_bytes,
+            "max_bytes": self.max_bytes,
+        }
+
+    def _remove(self, key: Hashable) -> None:
+        _, size, _, _ = self._entries.pop(key)
+        self.current_bytes -= size
+
+
+result_cache = ResultCache(CACHE_MAX_BYTES, CACHE_TTL_SECONDS)
+# Unknown slugs get their own, smaller LRU so bot scans cannot evict real results
+not_found_cache = ResultCache(CACHE_NEGATIVE_MAX_BYTES, CACHE_NEGATIVE_TTL_SECONDS)
+
+
+class CatalogVersionPoller:
+    """
+    Process-wide view of the catalog version, re-read at most every
+    `interval` seconds so cache hits don't need a database connection.
+    Writes from other processes become visible within that interval.
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.reset()
+
+    def reset(self) -> None:
+        self._version: Optional[int] = None
+        self._checked_at = 0.0
+
+    async def current(self) -> int:
+        now = time.monotonic()
+        if self._version is None or now - self._checked_at >= self.interval:
+            async with aiosqlite.connect(DB_NAME) as db:
+                self._version = await get_catalog_version(db)
+            self._checked_at = now
+        return self._version
+
+
+catalog_version = CatalogVersionPoller(CACHE_VERSION_CHECK_SECONDS)
+
 
 async def init_database():
     """Create tables if they don't exist"""
     async with aiosqlite.connect(DB_NAME) as db:
+        # WAL lets long-running readers (catalog exports) coexist with writers
+        await db.execute("PRAGMA journal_mode=WAL")
+        # Fire DELETE triggers for rows replaced by INSERT OR REPLACE (stats)
+        await db.execute("PRAGMA recursive_triggers=ON")
         await db.execute("""
             CREATE TABLE IF NOT EXISTS states (
                 slug TEXT PRIMARY KEY,
@@ -85,10 +253,304 @@ async def init_database():
                 FOREIGN KEY (city_slug) REFERENCES cities (slug)
             )
         """)
+        await db.execute("CREATE INDEX IF NOT EXISTS idx_services_city_slug ON services (city_slug)")
+
+        # Catalog version, bumped on every write so exports can be resumed safely
+        await db.execute("""
+            CREATE TABLE IF NOT EXISTS catalog_meta (
+                key TEXT PRIMARY KEY,
+                value INTEGER NOT NULL
+            )
+        """)
+        await db.execute("INSERT OR IGNORE INTO catalog_meta (key, value) VALUES ('version', 0)")
+        for table in ("states", "cities", "services"):
+            for op in ("INSERT", "UPDATE", "DELETE"):
+                await db.execute(f"""
+                    CREATE TRIGGER IF NOT EXISTS bump_version_{table}_{op.lower()}
+                    AFTER {op} ON {table}
+                    BEGIN
+                        UPDATE catalog_meta SET value = value + 1 WHERE key = 'version';
+                    END
+                """)
+        await init_stats_tables(db)
         await db.commit()
         logging.info("Database initialized (tables verified).")
 
 
+# Bump whenever the stats tables or triggers below change; existing
+# databases are then migrated and rebuilt once on the next start
+STATS_SCHEMA_VERSION = 2
+
+STATS_TRIGGERS = [
+    "stats_states_insert", "stats_states_delete", "stats_states_rename",
+    "stats_cities_insert", "stats_cities_delete", "stats_cities_update", "stats_cities_rename",
+    "stats_services_insert", "stats_services_delete", "stats_services_update",
+    # Superseded trigger names, dropped from older databases
+    "stats_services_move",
+]
+
+STATS_TABLES = ["stats_counters", "stats_state_cities", "stats_service_types"]
+
+
+def _live_city_sql(ref: str) -> str:
+    return f"EXISTS (SELECT 1 FROM cities WHERE slug = {ref}.city_slug)"
+
+
+def _stats_add_city_sql(ref: str) -> str:
+    """Trigger body counting city `ref` and the services already attached to it"""
+    return f"""
+        INSERT INTO stats_state_cities (state_slug, cities) VALUES ({ref}.state_slug, 1)
+            ON CONFLICT (state_slug) DO UPDATE SET cities = cities + 1;
+        UPDATE stats_counters SET value = value + 1 WHERE key = 'cities';
+        INSERT INTO stats_service_types (service_type, services, cities, placeholder_cities)
+            SELECT service_type, COUNT(*), 1, MAX(contact = '{PLACEHOLDER_CONTACT}')
+            FROM services WHERE city_slug = {ref}.slug GROUP BY service_type
+            ON CONFLICT (service_type) DO UPDATE SET
+                services = services + excluded.services,
+                cities = cities + 1,
+                placeholder_cities = placeholder_cities + excluded.placeholder_cities;
+        UPDATE stats_counters
+            SET value = value + (SELECT COUNT(*) FROM services WHERE city_slug = {ref}.slug)
+            WHERE key = 'services';
+    """
+
+
+def _stats_remove_city_sql(ref: str) -> str:
+    """Trigger body uncounting city `ref` and the services attached to it"""
+    return f"""
+        UPDATE stats_state_cities SET cities = cities - 1 WHERE state_slug = {ref}.state_slug;
+        UPDATE stats_counters SET value = value - 1 WHERE key = 'cities';
+        UPDATE stats_service_types SET
+            services = services - (
+                SELECT COUNT(*) FROM services
+                WHERE city_slug = {ref}.slug AND service_type = stats_service_types.service_type
+            ),
+            placeholder_cities = placeholder_cities - EXISTS (
+                SELECT 1 FROM services
+                WHERE city_slug = {ref}.slug AND service_type = stats_service_types.service_type
+                AND contact = '{PLACEHOLDER_CONTACT}'
+            ),
+            cities = cities - 1
+            WHERE service_type IN (SELECT service_type FROM services WHERE city_slug = {ref}.slug);
+        UPDATE stats_counters
+            SET value = value - (SELECT COUNT(*) FROM services WHERE city_slug = {ref}.slug)
+            WHERE key = 'services';
+    """
+
+
+def _stats_add_service_sql(city_guard: str = "1", placeholder_guard: str = "1") -> str:
+    """
+    Trigger body counting service NEW if its city exists. The guards stop an
+    UPDATE that keeps the (city, type) key, or the placeholder contact, from
+    counting the same city twice.
+    """
+    return f"""
+        INSERT INTO stats_service_types (service_type, services)
+            SELECT NEW.service_type, 1 WHERE {_live_city_sql("NEW")}
+            ON CONFLICT (service_type) DO UPDATE SET services = services + 1;
+        UPDATE stats_service_types SET cities = cities + 1
+            WHERE service_type = NEW.service_type
+            AND {city_guard}
+            AND {_live_city_sql("NEW")}
+            AND NOT EXISTS (
+                SELECT 1 FROM services
+                WHERE city_slug = NEW.city_slug AND service_type = NEW.service_type AND id <> NEW.id
+            );
+        UPDATE stats_service_types SET placeholder_cities = placeholder_cities + 1
+            WHERE service_type = NEW.service_type
+            AND NEW.contact = '{PLACEHOLDER_CONTACT}'
+            AND {placeholder_guard}
+            AND {_live_city_sql("NEW")}
+            AND NOT EXISTS (
+                SELECT 1 FROM services
+                WHERE city_slug = NEW.city_slug AND service_type = NEW.service_type AND id <> NEW.id
+                AND contact = '{PLACEHOLDER_CONTACT}'
+            );
+        UPDATE stats_counters SET value = value + 1
+            WHERE key = 'services' AND {_live_city_sql("NEW")};
+    """
+
+
+def _stats_remove_service_sql() -> str:
+    """Trigger body uncounting service OLD if its city exists"""
+    return f"""
+        UPDATE stats_service_types SET services = services - 1
+            WHERE service_type = OLD.service_type AND {_live_city_sql("OLD")};
+        UPDATE stats_service_types SET cities = cities - 1
+            WHERE service_type = OLD.service_type
+            AND {_live_city_sql("OLD")}
+            AND NOT EXISTS (
+                SELECT 1 FROM services
+                WHERE city_slug = OLD.city_slug AND service_type = OLD.service_type
+            );
+        UPDATE stats_service_types SET placeholder_cities = placeholder_cities - 1
+            WHERE service_type = OLD.service_type
+            AND OLD.contact = '{PLACEHOLDER_CONTACT}'
+            AND {_live_city_sql("OLD")}
+            AND NOT EXISTS (
+                SELECT 1 FROM services
+                WHERE city_slug = OLD.city_slug AND service_type = OLD.service_type
+                AND contact = '{PLACEHOLDER_CONTACT}'
+            );
+        UPDATE stats_counters SET value = value - 1
+            WHERE key = 'services' AND {_live_city_sql("OLD")};
+    """
+
+
+async def init_stats_tables(db: aiosqlite.Connection):
+    """
+    Create summary tables kept up to date by triggers on states, cities and
+    services, so /api/stats never has to GROUP BY over the catalog. Only
+    services whose city exists are counted; foreign keys are not enforced,
+    so city inserts, deletes and renames adjust the counts of the services
+    they (un)orphan.
+
+    SQLite only fires DELETE triggers for rows removed by INSERT OR REPLACE
+    when PRAGMA recursive_triggers is on, so every connection that writes
+    the catalog must enable it.
+
+    Tables and triggers are only (re)built when STATS_SCHEMA_VERSION differs
+    from the one stored in catalog_meta, i.e. once per schema change.
+    """
+    async with db.execute("SELECT value FROM catalog_meta WHERE key = 'stats_schema'") as cursor:
+        row = await cursor.fetchone()
+    if row and row[0] == STATS_SCHEMA_VERSION:
+        return
+
+    for trigger in STATS_TRIGGERS:
+        await db.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+    for table in STATS_TABLES:
+        await db.execute(f"DROP TABLE IF EXISTS {table}")
+
+    await db.execute("""
+        CREATE TABLE stats_counters (
+            key TEXT PRIMARY KEY,
+            value INTEGER NOT NULL
+        )
+    """)
+    await db.execute("""
+        CREATE TABLE stats_state_cities (
+            state_slug TEXT PRIMARY KEY,
+            cities INTEGER NOT NULL DEFAULT 0
+        )
+    """)
+    await db.execute("""
+        CREATE TABLE stats_service_types (
+            service_type TEXT PRIMARY KEY,
+            services INTEGER NOT NULL DEFAULT 0,
+            cities INTEGER NOT NULL DEFAULT 0,
+            placeholder_cities INTEGER NOT NULL DEFAULT 0
+        )
+    """)
+
+    # States are listed even without cities; rows left at zero by cities of
+    # unknown states are filtered out when reading
+    await db.execute("""
+        CREATE TRIGGER stats_states_insert AFTER INSERT ON states
+        BEGIN
+            INSERT OR IGNORE INTO stats_state_cities (state_slug, cities) VALUES (NEW.slug, 0);
+        END
+    """)
+    await db.execute("""
+        CREATE TRIGGER stats_states_delete AFTER DELETE ON states
+        BEGIN
+            DELETE FROM stats_state_cities WHERE state_slug = OLD.slug AND cities = 0;
+        END
+    """)
+    await db.execute("""
+        CREATE TRIGGER stats_states_rename AFTER UPDATE OF slug ON states
+        WHEN OLD.slug IS NOT NEW.slug
+        BEGIN
+            DELETE FROM stats_state_cities WHERE state_slug = OLD.slug AND cities = 0;
+            INSERT OR IGNORE INTO stats_state_cities (state_slug, cities) VALUES (NEW.slug, 0);
+        END
+    """)
+
+    await db.execute(f"""
+        CREATE TRIGGER stats_cities_insert AFTER INSERT ON cities
+        BEGIN {_stats_add_city_sql("NEW")} END
+    """)
+    await db.execute(f"""
+        CREATE TRIGGER stats_cities_delete AFTER DELETE ON cities
+        BEGIN {_stats_remove_city_sql("OLD")} END
+    """)
+    await db.execute(f"""
+        CREATE TRIGGER stats_cities_rename AFTER UPDATE OF slug ON cities
+        WHEN OLD.slug IS NOT NEW.slug
+        BEGIN {_stats_remove_city_sql("OLD")} {_stats_add_city_sql("NEW")} END
+    """)
+    await db.execute("""
+        CREATE TRIGGER stats_cities_update AFTER UPDATE OF state_slug ON cities
+        WHEN OLD.slug IS NEW.slug AND OLD.state_slug IS NOT NEW.state_slug
+        BEGIN
+            UPDATE stats_state_cities SET cities = cities - 1 WHERE state_slug = OLD.state_slug;
+            INSERT INTO stats_state_cities (state_slug, cities) VALUES (NEW.state_slug, 1)
+                ON CONFLICT (state_slug) DO UPDATE SET cities = cities + 1;
+        END
+    """)
+
+    # Services per type; `cities` and `placeholder_cities` count distinct cities
+    key_changed = "(OLD.city_slug IS NOT NEW.city_slug OR OLD.service_type IS NOT NEW.service_type)"
+    await db.execute(f"""
+        CREATE TRIGGER stats_services_insert AFTER INSERT ON services
+        BEGIN {_stats_add_service_sql()} END
+    """)
+    await db.execute(f"""
+        CREATE TRIGGER stats_services_delete AFTER DELETE ON services
+        BEGIN {_stats_remove_service_sql()} END
+    """)
+    await db.execute(f"""
+        CREATE TRIGGER stats_services_update AFTER UPDATE OF city_slug, service_type, contact ON services
+        BEGIN
+            {_stats_remove_service_sql()}
+            {_stats_add_service_sql(
+                city_guard=key_changed,
+                placeholder_guard=f"({key_changed} OR OLD.contact IS NOT '{PLACEHOLDER_CONTACT}')",
+            )}
+        END
+    """)
+
+    await rebuild_stats(db)
+    await db.execute(
+        "INSERT INTO catalog_meta (key, value) VALUES ('stats_schema', ?) "
+        "ON CONFLICT (key) DO UPDATE SET value = excluded.value",
+        (STATS_SCHEMA_VERSION,),
+    )
+
+
+async def rebuild_stats(db: aiosqlite.Connection):
+    """Recompute all summary tables from scratch"""
+    await db.execute("DELETE FROM stats_counters")
+    await db.execute("DELETE FROM stats_state_cities")
+    await db.execute("DELETE FROM stats_service_types")
+    await db.execute("""
+        INSERT INTO stats_counters (key, value)
+        VALUES ('cities', (SELECT COUNT(*) FROM cities)),
+               ('services', (SELECT COUNT(*) FROM services WHERE city_slug IN (SELECT slug FROM cities)))
+    """)
+    await db.execute("INSERT INTO stats_state_cities (state_slug, cities) SELECT slug, 0 FROM states")
+    await db.execute("""
+        INSERT INTO stats_state_cities (state_slug, cities)
+        SELECT state_slug, COUNT(*) FROM cities WHERE true GROUP BY state_slug
+        ON CONFLICT (state_slug) DO UPDATE SET cities = excluded.cities
+    """)
+    await db.execute("""
+        INSERT INTO stats_service_types (service_type, services, cities, placeholder_cities)
+        SELECT service_type, COUNT(*), COUNT(DISTINCT city_slug),
+               COUNT(DISTINCT CASE WHEN contact = ? THEN city_slug END)
+        FROM services WHERE city_slug IN (SELECT slug FROM cities)
+        GROUP BY service_type
+    """, (PLACEHOLDER_CONTACT,))
+    logging.info("Catalog statistics rebuilt.")
+
+
+async def get_catalog_version(db: aiosqlite.Connection) -> int:
+    """Return the current catalog version"""
+    async with db.execute("SELECT value FROM catalog_meta WHERE key = 'version'") as cursor:
+        row = await cursor.fetchone()
+        return row[0] if row else 0
+
+
 # Comprehensive India-wide database seeding
 async def seed_database():
     """
@@ -96,6 +558,7 @@ async def seed_database():
     """
     try:
         async with aiosqlite.connect(DB_NAME) as db:
+            await db.execute("PRAGMA recursive_triggers=ON")
             cursor = await db.execute("SELECT COUNT(*) FROM states")
             row = await cursor.fetchone()
             states_count = row[0]
@@ -303,7 +766,7 @@ async def seed_database():
                     ("Women Helpline", "1091", "Women's Safety Helpline - 24/7 support for women in distress"),
                     ("Child Helpline", "1098", "Child Helpline - Support for children in need of care and protection"),
                     ("Tourist Helpline", "1363", "India Tourism Helpline - Assistance for tourists"),
-                    ("Municipal Office", "1800-XXX-XXXX", "City Municipal Corporation - Civic services and complaints"),
+                    ("Municipal Office", PLACEHOLDER_CONTACT, "City Municipal Corporation - Civic services and complaints"),
                     ("Electricity Emergency", "1912", "Power Outage Helpline - Electricity supply issues"),
                     ("Water Supply", "1916", "Water Supply Helpline - Water supply issues and complaints"),
                     ("Disaster Management", "1070", "Disaster Management Authority - Natural disasters and emergencies"),
@@ -351,6 +814,12 @@ async def get_cities(state: Optional[str] = Query(None, description="Filter citi
     """
     Fetch cities, optionally filtered by state
     """
+    cache_key = ("cities", state)
+    version = await catalog_version.current()
+    cached = result_cache.get(cache_key, version)
+    if cached is not None:
+        return cached
+
     async with aiosqlite.connect(DB_NAME) as db:
         db.row_factory = aiosqlite.Row
         query = "SELECT name, slug, state_slug FROM cities"
@@ -364,7 +833,10 @@ async def get_cities(state: Optional[str] = Query(None, description="Filter citi
         
         async with db.execute(query, params) as cursor:
             rows = await cursor.fetchall()
-            return [dict(row) for row in rows]
+
+    cities = [dict(row) for row in rows]
+    result_cache.set(cache_key, cities, version)
+    return cities
 
 
 @api_router.get("/cities/{city_slug}", response_model=CityWithServices)
@@ -372,6 +844,15 @@ async def get_city_services(city_slug: str):
     """
     Fetch city details and all services for a specific city
     """
+    cache_key = ("city", city_slug)
+    version = await catalog_version.current()
+    cached = result_cache.get(cache_key, version)
+    if cached is not None:
+        return cached
+    # Negative misses are only counted once the slug turns out to be unknown
+    if not_found_cache.get(cache_key, version, count_miss=False):
+        raise HTTPException(status_code=404, detail=f"City '{city_slug}' not found")
+
     async with aiosqlite.connect(DB_NAME) as db:
         db.row_factory = aiosqlite.Row
         
@@ -380,6 +861,8 @@ async def get_city_services(city_slug: str):
             city = await cursor.fetchone()
             
         if not city:
+            not_found_cache.record_miss()
+            not_found_cache.set(cache_key, True, version)
             raise HTTPException(status_code=404, detail=f"City '{city_slug}' not found")
         
         # Get state name
@@ -391,12 +874,273 @@ async def get_city_services(city_slug: str):
         async with db.execute("SELECT city_slug, service_type, contact, description FROM services WHERE city_slug = ?", (city_slug,)) as cursor:
             services = await cursor.fetchall()
             
-        return {
-            "name": city['name'],
-            "slug": city['slug'],
-            "state_name": state_name,
-            "services": [dict(s) for s in services]
+    city_with_services = {
+        "name": city['name'],
+        "slug": city['slug'],
+        "state_name": state_name,
+        "services": [dict(s) for s in services]
+    }
+    result_cache.set(cache_key, city_with_services, version)
+    return city_with_services
+
+
+@api_router.get("/stats", response_model=CatalogStats)
+async def get_stats():
+    """
+    Catalog summary for the ops dashboard, read from the trigger-maintained
+    summary tables rather than aggregated over services
+    """
+    async with aiosqlite.connect(DB_NAME) as db:
+        db.row_factory = aiosqlite.Row
+        async with db.execute("SELECT key, value FROM stats_counters") as cursor:
+            counters = {row['key']: row['value'] for row in await cursor.fetchall()}
+        async with db.execute("""
+            SELECT state_slug, cities FROM stats_state_cities
+            WHERE cities > 0 OR state_slug IN (SELECT slug FROM states)
+            ORDER BY state_slug ASC
+        """) as cursor:
+            state_rows = await cursor.fetchall()
+        async with db.execute("SELECT * FROM stats_service_types WHERE services > 0 ORDER BY service_type ASC") as cursor:
+            type_rows = await cursor.fetchall()
+
+    total_cities = counters.get('cities', 0)
+    service_types = {
+        row['service_type']: {
+            "service_type": row['service_type'],
+            "services": row['services'],
+            "cities": row['cities'],
+            "missing_cities": total_cities - row['cities'],
+            "placeholder_cities": row['placeholder_cities'],
         }
+        for row in type_rows
+    }
+    women_helpline = service_types.get("Women Helpline", {})
+    municipal_office = service_types.get("Municipal Office", {})
+
+    return {
+        "total_cities": total_cities,
+        "total_services": counters.get('services', 0),
+        "cities_per_state": {row['state_slug']: row['cities'] for row in state_rows},
+        "service_types": list(service_types.values()),
+        "coverage_gaps": {
+            "cities_missing_women_helpline": women_helpline.get("missing_cities", total_cities),
+            "cities_with_placeholder_municipal_contact": municipal_office.get("placeholder_cities", 0),
+        },
+    }
+
+
+@api_router.get("/cache/stats", response_model=CacheReport)
+async def get_cache_stats():
+    """
+    Report hit, miss and eviction counters for the result caches
+    """
+    return {"results": result_cache.stats(), "not_found": not_found_cache.stats()}
+
+
+EXPORT_CSV_COLUMNS = [
+    "state_slug", "state_name", "city_slug", "city_name",
+    "service_id", "service_type", "contact", "description",
+]
+
+# Export output is buffered up to this many bytes per ASGI send
+EXPORT_CHUNK_BYTES = 64 * 1024
+
+
+async def iter_catalog_rows(
+    db: aiosqlite.Connection, after: Optional[str], after_service: Optional[int]
+) -> AsyncIterator[aiosqlite.Row]:
+    """
+    Yield the joined state/city/service rows in (city slug, service id) order
+    from a single cursor. aiosqlite fetches in small chunks, so memory use
+    stays flat. States without cities come first, as rows with a NULL
+    city_slug; a resumed export has already sent them.
+    """
+    query = """
+        SELECT st.slug AS state_slug, st.name AS state_name,
+               c.slug AS city_slug, c.name AS city_name,
+               s.id AS service_id, s.service_type, s.contact, s.description
+        FROM cities c
+        LEFT JOIN states st ON st.slug = c.state_slug
+        LEFT JOIN services s ON s.city_slug = c.slug
+    """
+    params = []
+    if after and after_service is not None:
+        query += " WHERE c.slug > ? OR (c.slug = ? AND s.id > ?)"
+        params.extend([after, after, after_service])
+    elif after:
+        query += " WHERE c.slug > ?"
+        params.append(after)
+    else:
+        query += """
+            UNION ALL
+            SELECT st.slug, st.name, NULL, NULL, NULL, NULL, NULL, NULL
+            FROM states st
+            WHERE NOT EXISTS (SELECT 1 FROM cities WHERE state_slug = st.slug)
+        """
+    query += " ORDER BY city_slug ASC, service_id ASC, state_slug ASC"
+
+    async with db.execute(query, params) as cursor:
+        async for row in cursor:
+            yield row
+
+
+async def export_ndjson(rows: AsyncIterator[aiosqlite.Row]) -> AsyncIterator[str]:
+    """
+    One JSON object per city, services nested as in /cities/{city_slug},
+    preceded by one object per state that has no cities
+    """
+    current = None
+    async for row in rows:
+        if row["city_slug"] is None:
+            yield json.dumps({"type": "state", "name": row["state_name"], "slug": row["state_slug"]}) + "\n"
+            continue
+        if current is None or current["slug"] != row["city_slug"]:
+            if current is not None:
+                yield json.dumps(current) + "\n"
+            current = {
+                "type": "city",
+                "name": row["city_name"],
+                "slug": row["city_slug"],
+                "state_slug": row["state_slug"],
+                "state_name": row["state_name"] or "Unknown",
+                "services": [],
+            }
+        if row["service_type"] is not None:
+            current["services"].append({
+                "city_slug": row["city_slug"],
+                "service_type": row["service_type"],
+                "contact": row["contact"],
+                "description": row["description"],
+            })
+    if current is not None:
+        yield json.dumps(current) + "\n"
+
+
+async def export_csv(rows: AsyncIterator[aiosqlite.Row]) -> AsyncIterator[str]:
+    """
+    One CSV line per service, with the city and state columns repeated.
+    States without cities get a line with the city columns left empty.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def line(values: list) -> str:
+        writer.writerow(values)
+        data = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate(0)
+        return data
+
+    yield line(EXPORT_CSV_COLUMNS)
+    async for row in rows:
+        yield line([row[column] for column in EXPORT_CSV_COLUMNS])
+
+
+async def batch_chunks(lines: AsyncIterator[str]) -> AsyncIterator[bytes]:
+    """Join lines into roughly EXPORT_CHUNK_BYTES sized chunks"""
+    pending = []
+    pending_size = 0
+    async for text in lines:
+        pending.append(text)
+        pending_size += len(text)
+        if pending_size >= EXPORT_CHUNK_BYTES:
+            yield "".join(pending).encode("utf-8")
+            pending = []
+            pending_size = 0
+    if pending:
+        yield "".join(pending).encode("utf-8")
+
+
+async def gzip_stream(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Compress a byte stream incrementally"""
+    compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16)
+    async for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+async def closing_stream(chunks: AsyncIterator[bytes], db: aiosqlite.Connection) -> AsyncIterator[bytes]:
+    """Release the export's read snapshot once the stream ends or is abandoned"""
+    try:
+        async for chunk in chunks:
+            yield chunk
+    finally:
+        await db.close()
+
+
+def accepts_gzip(accept_encoding: str) -> bool:
+    """Whether an Accept-Encoding header allows gzip, honouring q-values"""
+    qualities = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding.strip().lower()] = quality
+    return qualities.get("gzip", qualities.get("*", 0.0)) > 0
+
+
+@api_router.get("/export")
+async def export_catalog(
+    request: Request,
+    format: Literal["ndjson", "csv"] = Query("ndjson", description="Output format"),
+    after: Optional[str] = Query(None, description="Resume after this city slug"),
+    after_service: Optional[int] = Query(None, description="CSV only: resume after this service_id within `after`"),
+    version: Optional[int] = Query(None, description="Catalog version the resumed export started from"),
+):
+    """
+    Stream the full catalog (states, cities and services) for bulk mirroring.
+    Responses carry X-Catalog-Version; to resume an interrupted export, pass
+    that version back along with the position reached:
+    - NDJSON: `after` = slug of the last complete "city" line received
+    - CSV: `after` = city_slug and `after_service` = service_id of the last
+      complete row received (omit `after_service` if it was empty)
+    States without cities are sent before any city, so a stream that broke
+    before the first city is simply restarted from the beginning.
+    """
+    # The version header and the rows come from one read transaction
+    db = await aiosqlite.connect(DB_NAME)
+    try:
+        db.row_factory = aiosqlite.Row
+        await db.execute("BEGIN")
+        current_version = await get_catalog_version(db)
+        if version is not None and version != current_version:
+            raise HTTPException(
+                status_code=409,
+                detail=f"Catalog changed since version {version} (now {current_version}); restart the export",
+            )
+    except BaseException:
+        await db.close()
+        raise
+
+    rows = iter_catalog_rows(db, after, after_service if format == "csv" else None)
+    if format == "csv":
+        lines = export_csv(rows)
+        media_type = "text/csv"
+    else:
+        lines = export_ndjson(rows)
+        media_type = "application/x-ndjson"
+
+    body = batch_chunks(lines)
+    headers = {"X-Catalog-Version": str(current_version), "Vary": "Accept-Encoding"}
+    if accepts_gzip(request.headers.get("accept-encoding", "")):
+        body = gzip_stream(body)
+        headers["Content-Encoding"] = "gzip"
+
+    # The background close covers responses abandoned before streaming starts
+    return StreamingResponse(
+        closing_stream(body, db),
+        media_type=media_type,
+        headers=headers,
+        background=BackgroundTask(db.close),
+    )
 
 
 # Include the router in the main app
@@ -0,0 +1,36 @@
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+import server  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+
+@pytest.fixture
+def db_path(tmp_path, monkeypatch):
+    path = str(tmp_path / "askmycity-test.db")
+    monkeypatch.setattr(server, "DB_NAME", path)
+    monkeypatch.setattr(server, "result_cache", server.ResultCache(server.CACHE_MAX_BYTES))
+    monkeypatch.setattr(server, "not_found_cache", server.ResultCache(server.CACHE_NEGATIVE_MAX_BYTES))
+    server.catalog_version.reset()
+    return path
+
+
+@pytest.fixture
+def client(db_path):
+    """API client over a freshly seeded database"""
+    with TestClient(server.app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def db(client, db_path):
+    """Plain sqlite3 connection for writing behind the API's back, set up as an importer would be"""
+    conn = sqlite3.connect(db_path)
+    conn.execute("PRAGMA recursive_triggers=ON")
+    yield conn
+    conn.close()
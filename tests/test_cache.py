@@ -0,0 +1,123 @@
+import asyncio
+import time
+
+import aiosqlite
+
+import server
+from server import ResultCache, deep_sizeof
+
+
+def entry_size(key, value):
+    return deep_sizeof(key) + deep_sizeof(value) + ResultCache.ENTRY_OVERHEAD
+
+
+def test_lru_evicts_least_recently_used():
+    value = list(range(10))
+    cache = ResultCache(max_bytes=3 * entry_size("a", value))
+    for key in "abc":
+        cache.set(key, value, version=1)
+
+    assert cache.get("a", 1) == value  # "b" is now the oldest
+    cache.set("d", value, version=1)
+
+    assert cache.get("b", 1) is None
+    assert [cache.get(key, 1) for key in "acd"] == [value] * 3
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["bytes"] <= cache.max_bytes
+
+
+def test_oversized_values_are_not_stored():
+    cache = ResultCache(max_bytes=10)
+    cache.set("a", "x" * 100, version=1)
+    assert cache.stats()["entries"] == 0
+
+
+def test_ttl_expiry():
+    cache = ResultCache(max_bytes=10_000, ttl_seconds=0.05)
+    cache.set("a", 1, version=1)
+    assert cache.get("a", 1) == 1
+    time.sleep(0.06)
+    assert cache.get("a", 1) is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_entries_from_older_version_are_dropped():
+    cache = ResultCache(max_bytes=10_000)
+    cache.set("a", 1, version=1)
+    assert cache.get("a", 2) is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_counters():
+    cache = ResultCache(max_bytes=10_000)
+    cache.get("a", 1)
+    cache.set("a", 1, version=1)
+    cache.get("a", 1)
+    cache.get("a", 1)
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"]) == (2, 1, 0)
+    assert stats["bytes"] == entry_size("a", 1)
+
+
+def test_city_lookups_are_cached(client):
+    assert client.get("/api/cities/mumbai").status_code == 200
+    assert client.get("/api/cities/mumbai").status_code == 200
+    assert client.get("/api/cities/no-such-city").status_code == 404
+    assert client.get("/api/cities/no-such-city").status_code == 404
+
+    stats = client.get("/api/cache/stats").json()
+    assert stats["results"]["hits"] == 1
+    assert stats["not_found"]["hits"] == 1
+    assert stats["not_found"]["misses"] == 1
+    assert stats["not_found"]["entries"] == 1
+
+
+def test_cache_hits_do_not_open_connections(client, monkeypatch):
+    client.get("/api/cities/mumbai")
+    client.get("/api/cities/no-such-city")
+    client.get("/api/cities", params={"state": "goa"})
+
+    def refuse(*args, **kwargs):
+        raise AssertionError("cache hit opened a database connection")
+
+    monkeypatch.setattr(server.aiosqlite, "connect", refuse)
+    assert client.get("/api/cities/mumbai").status_code == 200
+    assert client.get("/api/cities/no-such-city").status_code == 404
+    assert client.get("/api/cities", params={"state": "goa"}).status_code == 200
+
+
+def test_valid_lookups_are_not_negative_misses(client):
+    client.get("/api/cities/mumbai")
+    client.get("/api/cities/pune")
+    assert client.get("/api/cache/stats").json()["not_found"]["misses"] == 0
+
+
+def test_unknown_slugs_do_not_evict_results(client, monkeypatch):
+    monkeypatch.setattr(server, "not_found_cache", ResultCache(max_bytes=2_000))
+    client.get("/api/cities/mumbai")
+    for i in range(200):
+        client.get(f"/api/cities/bot-probe-{i}")
+
+    assert server.not_found_cache.stats()["evictions"] > 0
+    assert server.result_cache.stats()["evictions"] == 0
+    assert server.result_cache.get(("city", "mumbai"), version=_version(client)) is not None
+
+
+def test_external_writes_invalidate_cached_results(client, db, monkeypatch):
+    monkeypatch.setattr(server.catalog_version, "interval", 0)
+    assert client.get("/api/cities/mumbai").status_code == 200
+    before = len(client.get("/api/cities", params={"state": "maharashtra"}).json())
+
+    db.execute("DELETE FROM cities WHERE slug = 'mumbai'")
+    db.commit()
+
+    assert client.get("/api/cities/mumbai").status_code == 404
+    assert len(client.get("/api/cities", params={"state": "maharashtra"}).json()) == before - 1
+
+
+def _version(client):
+    async def read():
+        async with aiosqlite.connect(server.DB_NAME) as db:
+            return await server.get_catalog_version(db)
+
+    return asyncio.run(read())
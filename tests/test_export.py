@@ -0,0 +1,148 @@
+import asyncio
+import csv
+import gzip
+import io
+import json
+import sqlite3
+
+import aiosqlite
+
+import server
+
+
+def catalog_counts(db):
+    cities = db.execute("SELECT COUNT(*) FROM cities").fetchone()[0]
+    services = db.execute("SELECT COUNT(*) FROM services").fetchone()[0]
+    return cities, services
+
+
+def parse_csv(text):
+    return list(csv.DictReader(io.StringIO(text)))
+
+
+def test_ndjson_has_one_line_per_city(client, db):
+    cities, services = catalog_counts(db)
+    response = client.get("/api/export")
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    records = [json.loads(line) for line in response.text.splitlines()]
+    assert all(record["type"] == "city" for record in records)
+    assert len(records) == cities
+    assert sum(len(record["services"]) for record in records) == services
+
+
+def test_states_without_cities_are_exported(client, db):
+    db.execute("INSERT INTO states (name, slug) VALUES ('Empty State', 'empty-state')")
+    db.commit()
+
+    records = [json.loads(line) for line in client.get("/api/export").text.splitlines()]
+    assert records[0] == {"type": "state", "name": "Empty State", "slug": "empty-state"}
+    assert [record["type"] for record in records[1:]] == ["city"] * (len(records) - 1)
+
+    rows = parse_csv(client.get("/api/export", params={"format": "csv"}).text)
+    assert rows[0]["state_slug"] == "empty-state"
+    assert rows[0]["city_slug"] == rows[0]["service_id"] == ""
+
+    resumed = client.get("/api/export", params={"after": records[1]["slug"]}).text
+    assert "empty-state" not in resumed
+
+
+def test_csv_has_one_row_per_service(client, db):
+    _, services = catalog_counts(db)
+    response = client.get("/api/export", params={"format": "csv"})
+    assert response.headers["content-type"].startswith("text/csv")
+
+    rows = parse_csv(response.text)
+    assert len(rows) == services
+    assert list(rows[0]) == server.EXPORT_CSV_COLUMNS
+
+
+def test_gzip_round_trip(client):
+    plain = client.get("/api/export", headers={"Accept-Encoding": "identity"})
+    compressed = client.get("/api/export", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in plain.headers
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert compressed.text == plain.text
+
+
+def test_gzip_q_zero_is_refused(client):
+    response = client.get("/api/export", headers={"Accept-Encoding": "gzip;q=0, identity"})
+    assert "content-encoding" not in response.headers
+
+
+def test_accepts_gzip():
+    assert server.accepts_gzip("gzip, deflate")
+    assert server.accepts_gzip("deflate, GZIP;q=0.5")
+    assert server.accepts_gzip("*")
+    assert not server.accepts_gzip("")
+    assert not server.accepts_gzip("gzip;q=0")
+    assert not server.accepts_gzip("*, gzip;q=0.0")
+
+
+def test_gzip_stream_decompresses(client):
+    async def collect():
+        async def chunks():
+            yield b"hello "
+            yield b"world"
+        return b"".join([chunk async for chunk in server.gzip_stream(chunks())])
+
+    assert gzip.decompress(asyncio.run(collect())) == b"hello world"
+
+
+def test_version_mismatch_is_rejected(client, db):
+    version = int(client.get("/api/export").headers["X-Catalog-Version"])
+    db.execute("UPDATE services SET contact = '999' WHERE id = 1")
+    db.commit()
+
+    response = client.get("/api/export", params={"after": "agra", "version": version})
+    assert response.status_code == 409
+
+
+def test_ndjson_resume(client):
+    full = client.get("/api/export")
+    version = full.headers["X-Catalog-Version"]
+    records = [json.loads(line) for line in full.text.splitlines()]
+
+    resumed = client.get("/api/export", params={"after": records[9]["slug"], "version": version})
+    assert resumed.status_code == 200
+    rest = [json.loads(line) for line in resumed.text.splitlines()]
+    assert records[:10] + rest == records
+
+
+def test_csv_resume_mid_city_keeps_remaining_services(client):
+    full = client.get("/api/export", params={"format": "csv"})
+    version = full.headers["X-Catalog-Version"]
+    rows = parse_csv(full.text)
+
+    # Break after the 5th of a city's 12 services
+    last = rows[16]
+    assert rows[17]["city_slug"] == last["city_slug"]
+
+    resumed = client.get("/api/export", params={
+        "format": "csv",
+        "after": last["city_slug"],
+        "after_service": last["service_id"],
+        "version": version,
+    })
+    assert rows[:17] + parse_csv(resumed.text) == rows
+
+
+def test_writes_succeed_while_export_is_paused(client, db_path):
+    async def paused_export():
+        async with aiosqlite.connect(server.DB_NAME) as reader:
+            reader.row_factory = aiosqlite.Row
+            await reader.execute("BEGIN")
+            version = await server.get_catalog_version(reader)
+            rows = server.iter_catalog_rows(reader, None, None)
+            await rows.__anext__()
+
+            writer = sqlite3.connect(db_path, timeout=0)
+            writer.execute("UPDATE services SET contact = '999' WHERE id = 1")
+            writer.commit()
+            writer.close()
+
+            # The reader still sees its snapshot
+            assert await server.get_catalog_version(reader) == version
+            await rows.aclose()
+
+    asyncio.run(paused_export())
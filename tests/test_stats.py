@@ -0,0 +1,159 @@
+import asyncio
+
+import aiosqlite
+import pytest
+
+import server
+
+
+def rebuilt_stats(client):
+    """/api/stats as recomputed from scratch by rebuild_stats"""
+    async def rebuild():
+        async with aiosqlite.connect(server.DB_NAME) as db:
+            await server.rebuild_stats(db)
+            await db.commit()
+
+    asyncio.run(rebuild())
+    return client.get("/api/stats").json()
+
+
+def assert_stats_consistent(client):
+    incremental = client.get("/api/stats").json()
+    assert incremental == rebuilt_stats(client)
+    for service_type in incremental["service_types"]:
+        assert service_type["missing_cities"] >= 0
+
+
+MUTATIONS = {
+    "insert_service_new_type": [
+        "INSERT INTO services (city_slug, service_type, contact, description) VALUES ('pune', 'Metro', '155', '')",
+    ],
+    "insert_duplicate_service": [
+        "INSERT INTO services (city_slug, service_type, contact, description) VALUES ('pune', 'Police', '100', '')",
+    ],
+    "delete_service": [
+        "DELETE FROM services WHERE city_slug = 'pune' AND service_type = 'Women Helpline'",
+    ],
+    "update_contact": [
+        "UPDATE services SET contact = '020-1234' WHERE city_slug = 'pune' AND service_type = 'Municipal Office'",
+        f"UPDATE services SET contact = '{server.PLACEHOLDER_CONTACT}' WHERE city_slug = 'pune' AND service_type = 'Police'",
+    ],
+    "placeholder_duplicate_in_city": [
+        f"INSERT INTO services (city_slug, service_type, contact, description) VALUES ('pune', 'Municipal Office', '{server.PLACEHOLDER_CONTACT}', '')",
+        "UPDATE services SET description = 'x', contact = '020-1234' WHERE id = (SELECT MAX(id) FROM services)",
+        f"UPDATE services SET contact = '{server.PLACEHOLDER_CONTACT}' WHERE id = (SELECT MAX(id) FROM services)",
+    ],
+    "update_service_type": [
+        "UPDATE services SET service_type = 'Tourist Helpline' WHERE city_slug = 'pune' AND service_type = 'Women Helpline'",
+    ],
+    "move_service": [
+        "UPDATE services SET city_slug = 'nagpur' WHERE city_slug = 'pune' AND service_type = 'Water Supply'",
+        "UPDATE services SET city_slug = 'no-such-city' WHERE city_slug = 'pune' AND service_type = 'Police'",
+    ],
+    "insert_city": [
+        "INSERT INTO cities (name, slug, state_slug) VALUES ('Nashik', 'nashik', 'maharashtra')",
+    ],
+    "insert_city_after_its_services": [
+        "INSERT INTO services (city_slug, service_type, contact, description) VALUES ('thane', 'Police', '100', '')",
+        "INSERT INTO cities (name, slug, state_slug) VALUES ('Thane', 'thane', 'maharashtra')",
+    ],
+    "delete_city": [
+        "DELETE FROM cities WHERE slug = 'mumbai'",
+    ],
+    "rename_city": [
+        "UPDATE cities SET slug = 'bombay', state_slug = 'goa' WHERE slug = 'mumbai'",
+    ],
+    "insert_or_replace_city": [
+        "INSERT OR REPLACE INTO cities (name, slug, state_slug) VALUES ('Mumbai', 'mumbai', 'maharashtra')",
+        "INSERT OR REPLACE INTO cities (name, slug, state_slug) VALUES ('Mumbai', 'mumbai', 'goa')",
+    ],
+    "insert_or_replace_service": [
+        "INSERT OR REPLACE INTO services (id, city_slug, service_type, contact, description) "
+        "SELECT id, city_slug, service_type, contact, description FROM services WHERE id = 1",
+        "INSERT OR REPLACE INTO services (id, city_slug, service_type, contact, description) "
+        "VALUES (1, 'pune', 'Metro', '155', '')",
+    ],
+    "insert_and_delete_state": [
+        "INSERT INTO states (name, slug) VALUES ('Empty State', 'empty-state')",
+        "UPDATE states SET slug = 'renamed-state' WHERE slug = 'empty-state'",
+        "DELETE FROM states WHERE slug = 'renamed-state'",
+    ],
+    "change_city_state": [
+        "UPDATE cities SET state_slug = 'goa' WHERE slug = 'pune'",
+    ],
+}
+
+
+@pytest.mark.parametrize("statements", MUTATIONS.values(), ids=MUTATIONS.keys())
+def test_stats_match_rebuild_after_mutation(client, db, statements):
+    assert_stats_consistent(client)
+    for statement in statements:
+        db.execute(statement)
+        db.commit()
+        assert_stats_consistent(client)
+
+
+def test_deleted_city_no_longer_counts_as_coverage(client, db):
+    db.execute("DELETE FROM cities WHERE slug = 'mumbai'")
+    db.execute("UPDATE services SET service_type = 'Other' WHERE city_slug = 'pune' AND service_type = 'Women Helpline'")
+    db.commit()
+
+    expected = db.execute("""
+        SELECT COUNT(*) FROM cities c
+        WHERE NOT EXISTS (
+            SELECT 1 FROM services s WHERE s.city_slug = c.slug AND s.service_type = 'Women Helpline'
+        )
+    """).fetchone()[0]
+    stats = client.get("/api/stats").json()
+    assert expected == 1
+    assert stats["coverage_gaps"]["cities_missing_women_helpline"] == expected
+
+
+def test_seeded_stats(client, db):
+    cities = db.execute("SELECT COUNT(*) FROM cities").fetchone()[0]
+    stats = client.get("/api/stats").json()
+
+    assert stats["total_cities"] == cities
+    assert stats["total_services"] == cities * 12
+    assert stats["cities_per_state"]["maharashtra"] == 3
+    assert stats["coverage_gaps"] == {
+        "cities_missing_women_helpline": 0,
+        "cities_with_placeholder_municipal_contact": cities,
+    }
+
+
+def test_insert_or_replace_keeps_totals(client, db):
+    before = client.get("/api/stats").json()
+    db.execute("INSERT OR REPLACE INTO cities (name, slug, state_slug) VALUES ('Mumbai', 'mumbai', 'maharashtra')")
+    db.execute("INSERT OR REPLACE INTO services (id, city_slug, service_type, contact, description) "
+               "SELECT id, city_slug, service_type, contact, description FROM services WHERE id = 1")
+    db.commit()
+    assert client.get("/api/stats").json() == before
+
+
+def test_states_without_cities_are_reported(client, db):
+    db.execute("INSERT INTO states (name, slug) VALUES ('Empty State', 'empty-state')")
+    db.execute("DELETE FROM cities WHERE state_slug = 'goa'")
+    db.commit()
+
+    cities_per_state = client.get("/api/stats").json()["cities_per_state"]
+    assert cities_per_state["empty-state"] == 0
+    assert cities_per_state["goa"] == 0
+
+
+def test_stats_are_only_rebuilt_on_schema_change(client, monkeypatch):
+    calls = []
+
+    async def counting_rebuild(db):
+        calls.append(db)
+
+    monkeypatch.setattr(server, "rebuild_stats", counting_rebuild)
+
+    async def restart(schema_version):
+        monkeypatch.setattr(server, "STATS_SCHEMA_VERSION", schema_version)
+        await server.init_database()
+
+    asyncio.run(restart(server.STATS_SCHEMA_VERSION))
+    assert calls == []
+    asyncio.run(restart(server.STATS_SCHEMA_VERSION + 1))
+    assert len(calls) == 1